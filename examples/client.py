@@ -3,13 +3,34 @@ Python client for Apartment Scraper API
 Compatible with Python 3.7+
 """
 
+import asyncio
+import json
+import random
 import requests
+import sys
 import time
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 
+try:
+    import httpx
+    from aiolimiter import AsyncLimiter
+except ImportError:  # only needed for AsyncApartmentScraperClient
+    httpx = None
 
-@dataclass
+# Responses worth retrying with backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+TERMINAL_STATUSES = {'completed', 'failed', 'cancelled'}
+
+# __slots__ dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ScrapeRequest:
     """Request object for starting a scrape"""
     city: str
@@ -18,7 +39,7 @@ class ScrapeRequest:
     max_pages: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class JobStatus:
     """Job status response"""
     job_id: str
@@ -30,6 +51,90 @@ class JobStatus:
     error: Optional[str] = None
 
 
+def _parse_job_status(data: Dict[str, Any]) -> JobStatus:
+    """Build a JobStatus from a status API response"""
+    # Positional, in field order
+    return JobStatus(
+        data['jobId'],
+        data['status'],
+        data['progress'],
+        data['createdAt'],
+        data['updatedAt'],
+        data.get('completedAt'),
+        data.get('error')
+    )
+
+
+def _cache_status(
+    etags: Dict[str, str],
+    statuses: Dict[str, JobStatus],
+    headers: Any,
+    status: JobStatus
+) -> None:
+    """
+    Remember a status and its ETag for conditional requests
+
+    Finished jobs won't be polled again, so their entries are dropped.
+    """
+    etag = headers.get('ETag')
+    if etag and status.status not in TERMINAL_STATUSES:
+        etags[status.job_id] = etag
+        statuses[status.job_id] = status
+    else:
+        etags.pop(status.job_id, None)
+        statuses.pop(status.job_id, None)
+
+
+def _next_poll_delay(
+    delay: float,
+    advanced: bool,
+    initial: float,
+    maximum: float
+) -> float:
+    """
+    Adaptive polling interval
+
+    Resets to the initial interval whenever the job moves to a new page,
+    otherwise doubles up to the maximum.
+    """
+    return initial if advanced else min(delay * 2, maximum)
+
+
+def _jitter(delay: float) -> float:
+    """Add up to 20% jitter so concurrent pollers don't synchronise"""
+    return delay + random.uniform(0, 0.2 * delay)
+
+
+def _print_progress(
+    last_progress: Dict[str, str],
+    job_id: str,
+    status: JobStatus,
+    prefix: str = ''
+) -> None:
+    """Print a job's progress line, but only when it has changed"""
+    line = (f"{prefix}Status: {status.status} - "
+            f"Page {status.progress['currentPage']}/{status.progress['totalPages']} - "
+            f"Scraped: {status.progress['listingsScraped']}")
+
+    if last_progress.get(job_id) != line:
+        last_progress[job_id] = line
+        print(line)
+
+
+def _build_payload(request: ScrapeRequest) -> Dict[str, Any]:
+    """Build the JSON body for /api/scrape/start"""
+    payload = {
+        'city': request.city,
+        'state': request.state,
+        'maxPages': request.max_pages,
+    }
+
+    if request.filters:
+        payload['filters'] = request.filters
+
+    return payload
+
+
 class ApartmentScraperClient:
     """Client for interacting with Apartment Scraper Worker API"""
     
@@ -44,6 +149,25 @@ class ApartmentScraperClient:
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.session = requests.Session()
+        self._last_progress: Dict[str, str] = {}
+        self._etags: Dict[str, str] = {}
+        self._statuses: Dict[str, JobStatus] = {}
+        
+        # Larger pool so concurrent callers share keep-alive connections,
+        # plus backoff retries for throttled / transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=sorted(RETRY_STATUSES),
+                # Let the final 429/5xx reach raise_for_status() as HTTPError
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         if api_key:
             self.session.headers['Authorization'] = f'Bearer {api_key}'
@@ -58,18 +182,9 @@ class ApartmentScraperClient:
         Returns:
             Dictionary with jobId and status
         """
-        payload = {
-            'city': request.city,
-            'state': request.state,
-            'maxPages': request.max_pages,
-        }
-        
-        if request.filters:
-            payload['filters'] = request.filters
-        
         response = self.session.post(
             f'{self.base_url}/api/scrape/start',
-            json=payload
+            json=_build_payload(request)
         )
         response.raise_for_status()
         
@@ -85,34 +200,43 @@ class ApartmentScraperClient:
         Returns:
             JobStatus object
         """
+        headers = {}
+        etag = self._etags.get(job_id)
+        if etag:
+            headers['If-None-Match'] = etag
+        
         response = self.session.get(
-            f'{self.base_url}/api/scrape/status/{job_id}'
+            f'{self.base_url}/api/scrape/status/{job_id}',
+            headers=headers
         )
+        
+        # Unchanged since the last poll: reuse the parsed status
+        if response.status_code == 304 and job_id in self._statuses:
+            return self._statuses[job_id]
+        
         response.raise_for_status()
         
-        data = response.json()
-        return JobStatus(
-            job_id=data['jobId'],
-            status=data['status'],
-            progress=data['progress'],
-            created_at=data['createdAt'],
-            updated_at=data['updatedAt'],
-            completed_at=data.get('completedAt'),
-            error=data.get('error')
-        )
+        status = _parse_job_status(response.json())
+        _cache_status(self._etags, self._statuses, response.headers, status)
+        return status
     
-    def get_results(self, job_id: str) -> Dict[str, Any]:
+    def get_results(self, job_id: str, columnar: bool = False) -> Dict[str, Any]:
         """
         Get the results of a completed job
         
         Args:
             job_id: Job ID
+            columnar: Ask for 'results' as a dict of column lists
+                ({'minPrice': [...], ...}). Workers that don't support
+                it still return a list of listings.
             
         Returns:
             Dictionary with results and metadata
         """
+        params = {'format': 'columnar'} if columnar else None
         response = self.session.get(
-            f'{self.base_url}/api/scrape/results/{job_id}'
+            f'{self.base_url}/api/scrape/results/{job_id}',
+            params=params
         )
         response.raise_for_status()
         
@@ -138,16 +262,23 @@ class ApartmentScraperClient:
     def poll_until_complete(
         self,
         job_id: str,
-        interval: int = 5,
-        timeout: int = 300
+        interval: float = 1,
+        timeout: int = 300,
+        columnar: bool = False,
+        max_interval: float = 30
     ) -> Dict[str, Any]:
         """
         Poll job status until it completes
         
+        The interval doubles while the job stays on the same page and
+        resets to the initial value when it advances.
+        
         Args:
             job_id: Job ID
-            interval: Polling interval in seconds
+            interval: Initial polling interval in seconds
             timeout: Maximum time to wait in seconds
+            columnar: Fetch results in columnar form (see get_results())
+            max_interval: Longest polling interval in seconds
             
         Returns:
             Job results when complete
@@ -157,60 +288,550 @@ class ApartmentScraperClient:
             RuntimeError: If job fails
         """
         start_time = time.time()
+        delay = interval
+        last_page = None
         
-        while time.time() - start_time < timeout:
-            status = self.get_status(job_id)
-            
-            if status.status == 'completed':
-                return self.get_results(job_id)
-            
-            if status.status == 'failed':
-                raise RuntimeError(f'Job failed: {status.error}')
-            
-            if status.status == 'cancelled':
-                raise RuntimeError('Job was cancelled')
-            
-            # Print progress
-            print(f"Status: {status.status} - "
-                  f"Page {status.progress['currentPage']}/{status.progress['totalPages']} - "
-                  f"Scraped: {status.progress['listingsScraped']}")
-            
-            time.sleep(interval)
+        try:
+            while time.time() - start_time < timeout:
+                status = self.get_status(job_id)
+                
+                if status.status == 'completed':
+                    return self.get_results(job_id, columnar=columnar)
+                
+                if status.status == 'failed':
+                    raise RuntimeError(f'Job failed: {status.error}')
+                
+                if status.status == 'cancelled':
+                    raise RuntimeError('Job was cancelled')
+                
+                # Print progress when it changes
+                _print_progress(self._last_progress, job_id, status)
+                
+                page = status.progress['currentPage']
+                delay = _next_poll_delay(
+                    delay, page != last_page, interval, max_interval
+                )
+                last_page = page
+                
+                # Don't oversleep the timeout now that intervals can grow
+                remaining = timeout - (time.time() - start_time)
+                time.sleep(max(0, min(_jitter(delay), remaining)))
+        finally:
+            self._last_progress.pop(job_id, None)
         
         raise TimeoutError(f'Job did not complete within {timeout} seconds')
     
     def scrape_and_wait(
         self,
         request: ScrapeRequest,
-        poll_interval: int = 5
-    ) -> List[Dict[str, Any]]:
+        poll_interval: float = 1,
+        columnar: bool = False
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
         """
         Convenience method to start a scrape and wait for completion
         
         Args:
             request: ScrapeRequest object
-            poll_interval: Polling interval in seconds
+            poll_interval: Initial polling interval in seconds
+            columnar: Ask for a dict of column lists instead of listings
             
         Returns:
-            List of scraped listings
+            List of scraped listings, or a dict of columns if the worker
+            supports columnar results
         """
         result = self.start_scrape(request)
         job_id = result['jobId']
         
         print(f"Job started: {job_id}")
         
-        results = self.poll_until_complete(job_id, poll_interval)
+        results = self.poll_until_complete(
+            job_id, poll_interval, columnar=columnar
+        )
         return results['results']
 
 
+class AsyncApartmentScraperClient:
+    """
+    asyncio client for the Apartment Scraper Worker API
+
+    Every network call is a coroutine, so many jobs can be started and
+    polled concurrently from a single event loop instead of one thread
+    per job. Create it inside a running event loop and close it when
+    done (or use it as an async context manager).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 100,
+        max_rate: float = 50,
+        time_period: float = 1,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        transport: Optional['httpx.AsyncBaseTransport'] = None
+    ):
+        """
+        Initialize the client
+
+        Args:
+            base_url: Base URL of the worker (e.g., https://apartment-scraper.workers.dev)
+            api_key: Optional API key for authentication
+            max_concurrency: Maximum number of in-flight HTTP requests
+            max_rate: Requests allowed per time_period. Independently of
+                this, requests pause when the server reports its
+                X-RateLimit-* budget is exhausted
+            time_period: Rate limit window in seconds
+            max_retries: Retries for 429/5xx responses
+            backoff_factor: Base delay in seconds for exponential backoff
+            transport: Optional custom httpx transport (e.g. one backed by
+                a different I/O layer). When given, it owns connection
+                pooling and HTTP version negotiation.
+        """
+        if httpx is None:
+            raise ImportError(
+                'AsyncApartmentScraperClient requires httpx[http2] and aiolimiter'
+            )
+
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+
+        headers = {}
+        if api_key:
+            headers['Authorization'] = f'Bearer {api_key}'
+
+        # HTTP/2 multiplexes concurrent polls over a few connections
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=50
+            ),
+            transport=transport
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rl = AsyncLimiter(max_rate, time_period)
+        self._paused_until = 0.0
+        self._batch_supported = True
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._last_progress: Dict[str, str] = {}
+        self._etags: Dict[str, str] = {}
+        self._statuses: Dict[str, JobStatus] = {}
+
+    async def __aenter__(self) -> 'AsyncApartmentScraperClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+    def _track_rate_limit(self, headers) -> None:
+        """
+        Honour the server's advertised budget
+
+        When X-RateLimit-Remaining reaches 0, holds back further requests
+        until X-RateLimit-Reset (seconds until the window resets, or an
+        epoch timestamp) instead of spending a request on a certain 429.
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining = float(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+
+        if remaining > 0:
+            return
+
+        if reset > 1e9:  # epoch seconds
+            reset -= time.time()
+        self._paused_until = max(
+            self._paused_until, time.monotonic() + max(reset, 0.0)
+        )
+
+    async def _wait_for_budget(self) -> None:
+        """Sleep until the server's rate limit window has reset"""
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, attempt: int, headers) -> float:
+        """Delay before the next retry, honouring Retry-After if present"""
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.backoff_factor * (2 ** attempt)
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request and return the decoded JSON body"""
+        response = await self._send(method, path, **kwargs)
+        return response.json()
+
+    async def _send(self, method: str, path: str, **kwargs) -> 'httpx.Response':
+        """
+        Send a request, retrying where safe, and return the response
+
+        429s are retried for every method; 5xx responses only for
+        idempotent ones so a retried start never creates duplicate jobs.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_budget()
+
+            async with self._semaphore:
+                async with self._rl:
+                    response = await self._client.request(
+                        method, f'{self.base_url}{path}', **kwargs
+                    )
+
+            self._track_rate_limit(response.headers)
+
+            retryable = response.status_code == 429 or (
+                response.status_code in RETRY_STATUSES
+                and method in IDEMPOTENT_METHODS
+            )
+            if not retryable or attempt == self.max_retries:
+                # httpx treats 3xx as errors; a 304 answers a conditional
+                # status request and is handled by the caller
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+
+            delay = self._retry_delay(attempt, response.headers)
+
+            # Sleep outside the semaphore so waiting retries don't hold a slot
+            await asyncio.sleep(delay)
+
+    async def start_scrape(self, request: ScrapeRequest) -> Dict[str, Any]:
+        """
+        Start a new scraping job
+
+        Args:
+            request: ScrapeRequest object with scraping parameters
+
+        Returns:
+            Dictionary with jobId and status
+        """
+        return await self._request(
+            'POST', '/api/scrape/start', json=_build_payload(request)
+        )
+
+    async def get_status(self, job_id: str) -> JobStatus:
+        """
+        Get the status of a job
+
+        Args:
+            job_id: Job ID returned from start_scrape()
+
+        Returns:
+            JobStatus object
+        """
+        headers = {}
+        etag = self._etags.get(job_id)
+        if etag:
+            headers['If-None-Match'] = etag
+
+        response = await self._send(
+            'GET', f'/api/scrape/status/{job_id}', headers=headers
+        )
+
+        # Unchanged since the last poll: reuse the parsed status
+        if response.status_code == 304 and job_id in self._statuses:
+            return self._statuses[job_id]
+
+        status = _parse_job_status(response.json())
+        _cache_status(self._etags, self._statuses, response.headers, status)
+        return status
+
+    async def get_statuses(self, job_ids: List[str]) -> Dict[str, JobStatus]:
+        """
+        Get the status of several jobs in one request
+
+        Falls back to one status request per job if the worker doesn't
+        expose the batch endpoint, and remembers that so later calls skip
+        the batch request.
+
+        Args:
+            job_ids: Job IDs returned from start_scrape()
+
+        Returns:
+            Dictionary mapping job ID to JobStatus
+        """
+        if self._batch_supported:
+            try:
+                data = await self._request(
+                    'POST', '/api/scrape/status/batch', json={'jobIds': job_ids}
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._batch_supported = False
+
+        if not self._batch_supported:
+            statuses = await asyncio.gather(*[
+                self.get_status(job_id) for job_id in job_ids
+            ])
+            return dict(zip(job_ids, statuses))
+
+        return {
+            job_id: _parse_job_status(status)
+            for job_id, status in data.items()
+        }
+
+    async def get_results(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get the results of a completed job
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Dictionary with results and metadata
+        """
+        return await self._request('GET', f'/api/scrape/results/{job_id}')
+
+    async def cancel_job(self, job_id: str) -> Dict[str, str]:
+        """
+        Cancel a running job
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Confirmation message
+        """
+        return await self._request('POST', f'/api/scrape/cancel/{job_id}')
+
+    async def stream_until_complete(
+        self,
+        job_id: str,
+        max_interval: float = 30.0
+    ) -> AsyncIterator[JobStatus]:
+        """
+        Yield status updates for a job until it reaches a final state
+
+        Subscribes to the server-sent events stream at
+        /api/scrape/events/{job_id}, so updates arrive as soon as the
+        server publishes them over a single long-lived connection. If the
+        events endpoint doesn't answer with a 2xx (not implemented,
+        throttled, or erroring) or the stream ends early, falls back to
+        polling, which retries through the usual backoff, with
+        exponentially growing intervals
+        (1s, 2s, 4s, ... capped at max_interval, back to 1s whenever the
+        job advances a page).
+
+        Args:
+            job_id: Job ID
+            max_interval: Maximum fallback polling interval in seconds
+
+        Yields:
+            JobStatus objects, the last one having a final status
+        """
+        await self._wait_for_budget()
+        await self._rl.acquire()
+        async with self._client.stream(
+            'GET',
+            f'{self.base_url}/api/scrape/events/{job_id}',
+            headers={'Accept': 'text/event-stream'},
+            timeout=None
+        ) as response:
+            self._track_rate_limit(response.headers)
+
+            if response.is_success:
+                data_lines = []
+                async for line in response.aiter_lines():
+                    if line.startswith('data:'):
+                        data_lines.append(line[5:].lstrip(' '))
+                        continue
+
+                    # A blank line terminates the event
+                    if line or not data_lines:
+                        continue
+
+                    status = _parse_job_status(json.loads('\n'.join(data_lines)))
+                    data_lines = []
+                    yield status
+
+                    if status.status in TERMINAL_STATUSES:
+                        return
+
+        delay = 1.0
+        last_page = None
+        while True:
+            status = await self.get_status(job_id)
+            yield status
+
+            if status.status in TERMINAL_STATUSES:
+                return
+
+            page = status.progress['currentPage']
+            delay = _next_poll_delay(delay, page != last_page, 1.0, max_interval)
+            last_page = page
+
+            await asyncio.sleep(_jitter(delay))
+
+    async def poll_until_complete(
+        self,
+        job_id: str,
+        timeout: int = 300
+    ) -> Dict[str, Any]:
+        """
+        Wait for a job to finish and return its results
+
+        Args:
+            job_id: Job ID
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Job results when complete
+
+        Raises:
+            TimeoutError: If job doesn't complete within timeout
+            RuntimeError: If job fails
+        """
+        async def wait_for_final_status() -> JobStatus:
+            async for status in self.stream_until_complete(job_id):
+                if status.status not in TERMINAL_STATUSES:
+                    _print_progress(
+                        self._last_progress, job_id, status, f'[{job_id}] '
+                    )
+            return status
+
+        try:
+            status = await asyncio.wait_for(wait_for_final_status(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'Job did not complete within {timeout} seconds')
+        finally:
+            self._last_progress.pop(job_id, None)
+
+        if status.status == 'failed':
+            raise RuntimeError(f'Job failed: {status.error}')
+
+        if status.status == 'cancelled':
+            raise RuntimeError('Job was cancelled')
+
+        return await self.get_results(job_id)
+
+    async def poll_until_complete_batch(
+        self,
+        job_ids: List[str],
+        interval: int = 5,
+        timeout: int = 300
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Poll several jobs with one batch status request per interval
+
+        Args:
+            job_ids: Job IDs
+            interval: Polling interval in seconds
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Dictionary mapping job ID to its results
+
+        Raises:
+            TimeoutError: If the jobs don't complete within timeout
+            RuntimeError: If any job fails or is cancelled
+        """
+        start_time = time.time()
+        pending = list(job_ids)
+        results = {}
+        reported = -1
+
+        while time.time() - start_time < timeout:
+            statuses = await self.get_statuses(pending)
+
+            for job_id, status in statuses.items():
+                if status.status == 'failed':
+                    raise RuntimeError(f'Job {job_id} failed: {status.error}')
+
+                if status.status == 'cancelled':
+                    raise RuntimeError(f'Job {job_id} was cancelled')
+
+            completed = [
+                job_id for job_id, status in statuses.items()
+                if status.status == 'completed'
+            ]
+            for job_id, result in zip(completed, await asyncio.gather(*[
+                self.get_results(job_id) for job_id in completed
+            ])):
+                results[job_id] = result
+                pending.remove(job_id)
+
+            if not pending:
+                return results
+
+            if len(results) != reported:
+                reported = len(results)
+                print(f"{reported}/{len(job_ids)} jobs complete")
+
+            await asyncio.sleep(interval)
+
+        raise TimeoutError(f'Jobs did not complete within {timeout} seconds')
+
+    async def scrape_and_wait(
+        self,
+        request: ScrapeRequest,
+        timeout: int = 300
+    ) -> List[Dict[str, Any]]:
+        """
+        Convenience method to start a scrape and wait for completion
+
+        Args:
+            request: ScrapeRequest object
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            List of scraped listings
+        """
+        result = await self.start_scrape(request)
+        job_id = result['jobId']
+
+        print(f"Job started: {job_id}")
+
+        results = await self.poll_until_complete(job_id, timeout)
+        return results['results']
+
+    async def scrape_many(
+        self,
+        requests: List[ScrapeRequest],
+        timeout: int = 300
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several scrapes concurrently and wait for all of them
+
+        Args:
+            requests: ScrapeRequest objects to run
+            timeout: Maximum time to wait for each job in seconds
+
+        Returns:
+            List of scraped listings per request, in request order
+        """
+        return await asyncio.gather(*[
+            self.scrape_and_wait(request, timeout)
+            for request in requests
+        ])
+
 # ============================================
 # Usage Examples
 # ============================================
 
+# Shared by the examples below so they reuse one connection pool
+CLIENT = ApartmentScraperClient('https://apartment-scraper.workers.dev')
+
+
 def basic_example():
     """Basic scraping example"""
-    client = ApartmentScraperClient('https://apartment-scraper.workers.dev')
-    
     request = ScrapeRequest(
         city='atlanta',
         state='ga',
@@ -223,18 +844,16 @@ def basic_example():
     )
     
     # Start job
-    result = client.start_scrape(request)
+    result = CLIENT.start_scrape(request)
     print(f"Job started: {result['jobId']}")
     
     # Check status
-    status = client.get_status(result['jobId'])
+    status = CLIENT.get_status(result['jobId'])
     print(f"Status: {status.status}")
 
 
 def scrape_and_wait_example():
     """Scrape and wait for completion"""
-    client = ApartmentScraperClient('https://apartment-scraper.workers.dev')
-    
     request = ScrapeRequest(
         city='austin',
         state='tx',
@@ -242,7 +861,7 @@ def scrape_and_wait_example():
     )
     
     try:
-        listings = client.scrape_and_wait(request)
+        listings = CLIENT.scrape_and_wait(request)
         print(f"Found {len(listings)} listings")
         
         # Print first listing
@@ -257,48 +876,58 @@ def scrape_and_wait_example():
 
 
 def multi_city_example():
-    """Scrape multiple cities in parallel"""
-    import concurrent.futures
-    
-    client = ApartmentScraperClient('https://apartment-scraper.workers.dev')
-    
+    """Scrape multiple cities concurrently"""
     cities = [
         ScrapeRequest(city='atlanta', state='ga', max_pages=3),
         ScrapeRequest(city='austin', state='tx', max_pages=3),
         ScrapeRequest(city='denver', state='co', max_pages=3),
     ]
-    
-    # Start all jobs
-    jobs = [client.start_scrape(req) for req in cities]
-    print(f"Started {len(jobs)} jobs")
-    
-    # Wait for all to complete in parallel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [
-            executor.submit(client.poll_until_complete, job['jobId'])
-            for job in jobs
-        ]
-        
-        results = [future.result() for future in futures]
-    
-    # Print summary
-    for i, result in enumerate(results):
-        print(f"{cities[i].city}: {len(result['results'])} listings")
+
+    async def run() -> Dict[str, List[Dict[str, Any]]]:
+        async with AsyncApartmentScraperClient(
+            'https://apartment-scraper.workers.dev'
+        ) as client:
+            async def scrape_city(request: ScrapeRequest):
+                return request.city, await client.scrape_and_wait(request)
+
+            # Handle each city as soon as its job finishes rather than
+            # waiting for the slowest one
+            results = {}
+            for next_done in asyncio.as_completed(
+                [scrape_city(request) for request in cities]
+            ):
+                city, listings = await next_done
+                results[city] = listings
+                print(f"{city}: {len(listings)} listings")
+
+            return results
+
+    # Start and wait for all jobs on a single event loop. uvloop is a
+    # faster drop-in loop when installed; it isn't available on Windows,
+    # where the default asyncio loop is used.
+    try:
+        import uvloop
+    except ImportError:
+        results = asyncio.run(run())
+    else:
+        results = uvloop.run(run())
+    print(f"Scraped {sum(map(len, results.values()))} listings "
+          f"across {len(results)} cities")
 
 
 def pandas_example():
     """Export results to pandas DataFrame"""
     import pandas as pd
     
-    client = ApartmentScraperClient('https://apartment-scraper.workers.dev')
-    
     request = ScrapeRequest(
         city='seattle',
         state='wa',
         max_pages=2
     )
     
-    listings = client.scrape_and_wait(request)
+    # Column-oriented results build the DataFrame without transposing
+    # one dict per listing; pandas accepts either shape
+    listings = CLIENT.scrape_and_wait(request, columnar=True)
     
     # Convert to DataFrame
     df = pd.DataFrame(listings)
@@ -318,8 +947,7 @@ def pandas_example():
 def save_to_database_example():
     """Save results to your own database"""
     import psycopg2
-    
-    client = ApartmentScraperClient('https://apartment-scraper.workers.dev')
+    from psycopg2.extras import execute_values
     
     request = ScrapeRequest(
         city='portland',
@@ -327,7 +955,7 @@ def save_to_database_example():
         max_pages=3
     )
     
-    listings = client.scrape_and_wait(request)
+    listings = CLIENT.scrape_and_wait(request)
     
     # Connect to your database
     conn = psycopg2.connect(
@@ -339,23 +967,31 @@ def save_to_database_example():
     
     cur = conn.cursor()
     
-    # Insert listings
-    for listing in listings:
-        cur.execute("""
-            INSERT INTO apartments (name, address, city, state, min_price, max_price)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON CONFLICT (address, city, state) DO UPDATE
-            SET min_price = EXCLUDED.min_price,
-                max_price = EXCLUDED.max_price,
-                updated_at = NOW()
-        """, (
+    # Insert listings as multi-row INSERTs (one round trip per page_size rows)
+    rows = [
+        (
             listing['propertyName'],
             listing['address'],
             listing['city'],
             listing['state'],
             listing.get('minPrice'),
             listing.get('maxPrice')
-        ))
+        )
+        for listing in listings
+    ]
+    
+    # One statement can't upsert the same key twice, and multi-page
+    # scrapes can repeat a property: keep the last row per key
+    rows = list({(row[1], row[2], row[3]): row for row in rows}.values())
+    
+    execute_values(cur, """
+        INSERT INTO apartments (name, address, city, state, min_price, max_price)
+        VALUES %s
+        ON CONFLICT (address, city, state) DO UPDATE
+        SET min_price = EXCLUDED.min_price,
+            max_price = EXCLUDED.max_price,
+            updated_at = NOW()
+    """, rows, page_size=1000)
     
     conn.commit()
     cur.close()
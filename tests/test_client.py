@@ -0,0 +1,51 @@
+"""Tests for the Python example client (examples/client.py)"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('aiolimiter')
+pytest.importorskip('requests')
+
+CLIENT_PATH = Path(__file__).resolve().parent.parent / 'examples' / 'client.py'
+
+
+def load_client_module():
+    spec = importlib.util.spec_from_file_location('apartment_client', CLIENT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_async_get_status_reuses_cached_status_on_304():
+    client_module = load_client_module()
+    seen_etags = []
+
+    def handler(request):
+        seen_etags.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(200, headers={'ETag': '"v1"'}, json={
+            'jobId': 'job-1',
+            'status': 'processing',
+            'progress': {'currentPage': 1, 'totalPages': 3, 'listingsScraped': 20},
+            'createdAt': '2024-01-01T00:00:00Z',
+            'updatedAt': '2024-01-01T00:00:05Z',
+        })
+
+    async def fetch_twice():
+        async with client_module.AsyncApartmentScraperClient(
+            'https://scraper.test', transport=httpx.MockTransport(handler)
+        ) as client:
+            first = await client.get_status('job-1')
+            second = await client.get_status('job-1')
+            return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert seen_etags == [None, '"v1"']
+    assert first.status == 'processing'
+    assert second is first